@@ -1,373 +1,694 @@
-# -*- encoding:utf-8 -*-
-
-"""
-This package aims to perform simple requests to [`EPSG GeoRepository API`](htt\
-ps://apps.epsg.org/api/swagger/ui/index) and provides associated geodesic
-computation and map projection.
-"""
-
-import os
-import sys
-import math
-import ctypes
-import typing
-
-from epsglide import dataset
-from epsglide.geodesy import Geodetic, _dms
-
-_TORAD = math.pi/180.0
-_TODEG = 180.0/math.pi
-
-try:
-    WGS84 = dataset.GeodeticCoordRefSystem(4326)
-except Exception:
-    WGS84 = None
-
-
-# find data file
-def _get_file(name: str) -> str:
-    """
-    Find data file in epsg package pathes.
-    """
-    for path in __path__:
-        filename = os.path.join(path, name)
-        if os.path.exists(filename):
-            return filename
-    raise IOError("%s data file not found" % name)
-
-
-class Geocentric(ctypes.Structure):
-    """
-    `ctypes` structure for geocentric coordinates. This reference is generaly
-    used as a transition for datum transformation. Coordinates are expressed in
-    metres.
-
-    Attributes:
-        x (float): X-axis value
-        y (float): Y-axis value
-        z (float): Z-axis value
-
-    ```python
-    >>> epsglide.Geocentric(4457584, 429216, 4526544)
-    <X=4457584.000 Y=429216.000 Z=4526544.000>
-    >>> epsglide.Geocentric(x=4457584, y=429216, z=4526544)
-    <X=4457584.000 Y=429216.000 Z=4526544.000>
-    ```
-    """
-    _fields_ = [
-        ("x", ctypes.c_double),
-        ("y", ctypes.c_double),
-        ("z", ctypes.c_double)
-    ]
-
-    def __repr__(self) -> str:
-        return f"<X={self.x:.3f} Y={self.y:.3f} Z={self.z:.3f}>"
-
-
-class Geographic(ctypes.Structure):
-    """
-    `ctypes` structure for geographic coordinates ie 2D coordinates on
-    flattened earth with elevation as third dimension.
-
-    Attributes:
-        x (float): X-projection-axis value
-        y (float): Y-projection-axis value
-        altitude (float): elevation in meters
-
-    ```python
-    >>> epsglide.Geographic(5721186, 2948518, 105)
-    <X=5721186.000 Y=2948518.000 alt=105.000>
-    >>> epsglide.Geographic(x=5721186, y=2948518, altitude=105)
-    <X=5721186.000 Y=2948518.000 alt=105.000>
-    ```
-    """
-    _fields_ = [
-        ("x", ctypes.c_double),
-        ("y", ctypes.c_double),
-        ("altitude", ctypes.c_double)
-    ]
-
-    def __repr__(self) -> str:
-        if hasattr(self, "_unit"):
-            prefix = f"{self._unit.Name}:{self._unit.ratio:.3f}"
-        else:
-            prefix = "metre:1.000"
-        return \
-            f"<{prefix}[X={self.x:.3f} Y={self.y:.3f}]" \
-            f" alt={self.altitude:.3f}>"
-
-
-class Vincenty_dist(ctypes.Structure):
-    r"""
-    Great circle distance computation result using Vincenty formulae.
-
-    Attributes:
-        distance (float): great circle distance in meters
-        initial_bearing (float): initial bearing in radians
-        final_bearing (float): final bearing in radians
-    """
-    _fields_ = [
-        ("distance", ctypes.c_double),
-        ("initial_bearing", ctypes.c_double),
-        ("final_bearing", ctypes.c_double)
-    ]
-
-    def __repr__(self) -> str:
-        return \
-            f"<{self.distance/1000:.3f}km " \
-            f"initial bearing={math.degrees(self.initial_bearing):.1f}° " \
-            f"final bearing{math.degrees(self.final_bearing):.1f}°>"
-
-
-class Vincenty_dest(ctypes.Structure):
-    """
-    Great circle destination computation result using Vincenty formulae.
-
-    Attributes:
-        longitude (float): destination longitude in radians
-        latitude (float): destination latitude in radians
-        destination_bearing (float): destination bearing in radians
-    """
-    _fields_ = [
-        ("longitude", ctypes.c_double),
-        ("latitude", ctypes.c_double),
-        ("destination_bearing", ctypes.c_double)
-    ]
-
-    def __repr__(self) -> str:
-        return \
-            f"<lon={_dms(math.degrees(self.longitude))} " \
-            f"lat={_dms(math.degrees(self.latitude))} " \
-            f"end bearing={math.degrees(self.destination_bearing):.1f}°>"
-
-
-def distance(
-    obj: dataset.Ellipsoid, start: Geodetic, stop: Geodetic
-) -> Vincenty_dist:
-    """
-    Calculate the distance between two points on the ellipsoid surface.
-
-    Args:
-        obj (dataset.Ellipsoid): The ellipsoid object representing the shape of
-            the Earth.
-        start (Geodetic): The starting point.
-        stop (Geodetic): The destination point.
-
-    Returns:
-        Vincenty_dist: The distance between the two points.
-    """
-    return geoid.distance(obj._struct_, start, stop)
-
-
-def destination(
-    obj: dataset.Ellipsoid, start: Geodetic, dist: Vincenty_dist
-) -> Vincenty_dest:
-    """
-    Calculate the destination point given start point, initial bearing, and
-    distance.
-
-    Args:
-        obj (dataset.Ellipsoid): The ellipsoid object representing the shape of
-            the Earth.
-        start (Geodetic): The starting point.
-        dist (Vincenty_dist): The distance to travel.
-
-    Returns:
-        Vincenty_dest: The destination point.
-    """
-    return geoid.destination(obj._struct_, start, dist)
-
-
-def to_crs(
-    obj: dataset.GeodeticCoordRefSystem, crs: dataset.GeodeticCoordRefSystem,
-    lla: Geodetic
-) -> Geodetic:
-    """
-    Convert coordinates from one geodetic coordinate reference system to
-    another.
-
-    Args:
-        obj (dataset.GeodeticCoordRefSystem): The source coordinate reference
-            system.
-        crs (dataset.GeodeticCoordRefSystem): The target coordinate reference
-            system.
-        lla (Geodetic): The coordinates to convert.
-
-    Returns:
-        Geodetic: The converted coordinates.
-    """
-    return geoid.lla_dat2dat(obj._struct_, crs._struct_, lla)
-
-
-def to_wgs84(
-    obj: dataset.GeodeticCoordRefSystem, lla: Geodetic
-) -> Geodetic:
-    """
-    Convert coordinates from a geodetic coordinate reference system to WGS84.
-
-    Args:
-        obj (dataset.GeodeticCoordRefSystem): The source coordinate reference
-            system.
-        lla (Geodetic): The coordinates to convert.
-
-    Returns:
-        Geodetic: The converted coordinates in WGS84.
-    """
-    return geoid.lla_dat2dat(obj._struct_, WGS84._struct_, lla)
-
-
-dataset.GeodeticCoordRefSystem.to_wgs84 = to_wgs84
-dataset.GeodeticCoordRefSystem.to_crs = to_crs
-dataset.Ellipsoid.distance = distance
-dataset.Ellipsoid.destination = destination
-
-
-class ProjectedCoordRefSystem(dataset.EpsgElement):
-    """
-    Coordinate reference system object allowing projection of geodetic
-    coordinates to flat map (geographic coordinates).
-
-    ```python
-    >>> import epsglide
-    >>> osgb36 = epsglide.ProjectedCoordRefSystem(27700)
-    >>> london = epsglide.Geodetic(-0.127005, 51.518602, 0.)  # use degrees
-    >>> osgb36(london)
-    <metre:1.000[X=529939.106 Y=181680.962] alt=0.000>
-    >>> osgb36.Projection
-    {'Code': 19916, 'Name': 'British National Grid', 'href': 'https://apps.eps\
-g.org/api/v1/Conversion/19916'}
-    ```
-
-    Attributes:
-        GeodeticCoordRefSystem (dataset.GeodeticCoordRefSystem): geodetic
-            reference system.
-        Conversion (dataset.Conversion): projection method and parameters.
-        CoordOperationMethod (dataset.CoordOperationMethod): projection
-            description.
-        CoordSystem (dataset.CoordSystem): 2D coordinate system and units.
-        parameters (list): list of `dataset.CoordOperationParameter`.
-    """
-
-    def populate(self):
-        self.GeodeticCoordRefSystem = dataset.GeodeticCoordRefSystem(
-            self.BaseCoordRefSystem["Code"]
-        )
-        self._struct_ = dataset.src.Crs()
-        self._struct_.datum = self.GeodeticCoordRefSystem._struct_
-
-        self.Conversion = dataset.Conversion(self.Projection["Code"])
-        self.CoordOperationMethod = dataset.CoordOperationMethod(
-            self.Conversion.Method["Code"]
-        )
-
-        coordsys = dataset.CoordSystem(self.CoordSys["Code"])
-        self.x_unit = dataset.Unit(coordsys.Axis[0]["Unit"]["Code"])
-        self.y_unit = dataset.Unit(coordsys.Axis[1]["Unit"]["Code"])
-        self.CoordSystem = coordsys
-
-        self.parameters = []
-        for param in self.Conversion.ParameterValues:
-            code = param["ParameterCode"]
-            if code in dataset.PROJ_PARAMETER_CODES:
-                attr = dataset.PROJ_PARAMETER_CODES[code]
-                setattr(
-                    self._struct_, attr, param["ParameterValue"] *
-                    (1.0 if attr in "x0y0k0" else _TORAD)
-                )
-                self.parameters.append(dataset.CoordOperationParameter(code))
-
-        name = dataset.PROJ_METHOD_CODES.get(
-            self.CoordOperationMethod.id, False
-        )
-        if name:
-            self._proj_forward = getattr(proj, f"{name}_forward")
-            self._proj_forward.restype = Geographic
-            self._proj_forward.argtypes = [
-                ctypes.POINTER(dataset.src.Crs),
-                ctypes.POINTER(Geodetic)
-            ]
-            self._proj_inverse = getattr(proj, f"{name}_inverse")
-            self._proj_inverse.restype = Geodetic
-            self._proj_inverse.argtypes = [
-                ctypes.POINTER(dataset.src.Crs),
-                ctypes.POINTER(Geographic)
-            ]
-
-    def __call__(
-        self, element: typing.Union[Geodetic, Geographic]
-    ) -> typing.Union[Geodetic, Geographic]:
-        """
-        """
-
-        if isinstance(element, Geodetic):
-            longitude = element.longitude + self._struct_.datum.prime.longitude
-            lla = Geodetic(
-                longitude * _TODEG, element.latitude * _TODEG, element.altitude
-            )
-            xya = self.forward(lla)
-            xya.x /= self.x_unit.ratio
-            xya.y /= self.y_unit.ratio
-            setattr(xya, "_unit", self.x_unit)
-            return xya
-        else:
-            xya = Geographic(
-                element.x * self.x_unit.ratio, element.y * self.y_unit.ratio,
-                element.altitude
-            )
-            lla = self.inverse(xya)
-            lla.longitude -= self._struct_.datum.prime.longitude
-            return lla
-
-    def forward(self, lla: Geodetic) -> Geographic:
-        return self._proj_forward(self._struct_, lla)
-
-    def inverse(self, xya: Geographic) -> Geodetic:
-        return self._proj_inverse(self._struct_, xya)
-
-    def transform(
-        self, element: typing.Union[Geodetic, Geographic], dest_crs
-    ) -> Geographic:
-        """
-        """
-        lla = element if isinstance(element, Geodetic) else self(element)
-        return dest_crs(geoid.lla_dat2da(self._struct, dest_crs._strut_, lla))
-
-
-#######################
-# loading C libraries #
-#######################
-# defining library name
-__dll_ext__ = "dll" if sys.platform.startswith("win") else "so"
-geoid = ctypes.CDLL(_get_file("geoid.%s" % __dll_ext__))
-proj = ctypes.CDLL(_get_file("proj.%s" % __dll_ext__))
-
-geoid.geocentric.argtypes = [
-    ctypes.POINTER(dataset.src.Ellipsoid), ctypes.POINTER(Geodetic)
-]
-geoid.geocentric.restype = Geocentric
-
-geoid.geodetic.argtypes = [
-    ctypes.POINTER(dataset.src.Ellipsoid), ctypes.POINTER(Geocentric)
-]
-geoid.geodetic.restype = Geodetic
-
-geoid.distance.argtypes = [
-    ctypes.POINTER(dataset.src.Ellipsoid),
-    ctypes.POINTER(Geodetic),
-    ctypes.POINTER(Geodetic)
-]
-geoid.distance.restype = Vincenty_dist
-
-geoid.destination.argtypes = [
-    ctypes.POINTER(dataset.src.Ellipsoid),
-    ctypes.POINTER(Geodetic),
-    ctypes.POINTER(Vincenty_dist)
-]
-geoid.destination.restype = Vincenty_dest
-
-geoid.lla_dat2dat.argtypes = [
-    ctypes.POINTER(dataset.src.Datum),
-    ctypes.POINTER(dataset.src.Datum),
-    ctypes.POINTER(Geodetic)
-]
-geoid.lla_dat2dat.restype = Geodetic
+# -*- encoding:utf-8 -*-
+
+"""
+This package aims to perform simple requests to [`EPSG GeoRepository API`](htt\
+ps://apps.epsg.org/api/swagger/ui/index) and provides associated geodesic
+computation and map projection.
+"""
+
+import os
+import sys
+import math
+import ctypes
+import typing
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - numpy only needed for batch mode
+    numpy = None
+
+try:
+    from epsglide import _proj_numba
+except ImportError:  # pragma: no cover - numba fallback kernels are optional
+    _proj_numba = None
+
+try:
+    from epsglide import _geoid
+except ImportError:  # pragma: no cover - fall back on the ctypes binding
+    _geoid = None
+
+try:
+    from epsglide import _vincenty_numba
+except ImportError:  # pragma: no cover - numba ufunc is optional
+    _vincenty_numba = None
+
+from epsglide import dataset
+from epsglide.geodesy import Geodetic, _dms
+
+_TORAD = math.pi/180.0
+_TODEG = 180.0/math.pi
+
+#: projection parameters stored as-is, every other one is an angle given in
+#: degrees by the EPSG dataset and converted to radians
+_SCALAR_PARAMS = frozenset(("x0", "y0", "k0"))
+
+try:
+    WGS84 = dataset.GeodeticCoordRefSystem(4326)
+except Exception:
+    WGS84 = None
+
+
+def _dptr(arr: "numpy.ndarray"):
+    """
+    Return the underlying double pointer of a numpy array.
+    """
+    return arr.ctypes.data_as(_PDouble)
+
+
+# find data file
+def _get_file(name: str) -> str:
+    """
+    Find data file in epsg package pathes.
+    """
+    for path in __path__:
+        filename = os.path.join(path, name)
+        if os.path.exists(filename):
+            return filename
+    raise IOError("%s data file not found" % name)
+
+
+class Geocentric(ctypes.Structure):
+    """
+    `ctypes` structure for geocentric coordinates. This reference is generaly
+    used as a transition for datum transformation. Coordinates are expressed in
+    metres.
+
+    Attributes:
+        x (float): X-axis value
+        y (float): Y-axis value
+        z (float): Z-axis value
+
+    ```python
+    >>> epsglide.Geocentric(4457584, 429216, 4526544)
+    <X=4457584.000 Y=429216.000 Z=4526544.000>
+    >>> epsglide.Geocentric(x=4457584, y=429216, z=4526544)
+    <X=4457584.000 Y=429216.000 Z=4526544.000>
+    ```
+    """
+    _fields_ = [
+        ("x", ctypes.c_double),
+        ("y", ctypes.c_double),
+        ("z", ctypes.c_double)
+    ]
+
+    def __repr__(self) -> str:
+        return f"<X={self.x:.3f} Y={self.y:.3f} Z={self.z:.3f}>"
+
+
+class Geographic(ctypes.Structure):
+    """
+    `ctypes` structure for geographic coordinates ie 2D coordinates on
+    flattened earth with elevation as third dimension.
+
+    Attributes:
+        x (float): X-projection-axis value
+        y (float): Y-projection-axis value
+        altitude (float): elevation in meters
+
+    ```python
+    >>> epsglide.Geographic(5721186, 2948518, 105)
+    <X=5721186.000 Y=2948518.000 alt=105.000>
+    >>> epsglide.Geographic(x=5721186, y=2948518, altitude=105)
+    <X=5721186.000 Y=2948518.000 alt=105.000>
+    ```
+    """
+    _fields_ = [
+        ("x", ctypes.c_double),
+        ("y", ctypes.c_double),
+        ("altitude", ctypes.c_double)
+    ]
+
+    def __repr__(self) -> str:
+        if hasattr(self, "_unit"):
+            prefix = f"{self._unit.Name}:{self._unit.ratio:.3f}"
+        else:
+            prefix = "metre:1.000"
+        return \
+            f"<{prefix}[X={self.x:.3f} Y={self.y:.3f}]" \
+            f" alt={self.altitude:.3f}>"
+
+
+class Vincenty_dist(ctypes.Structure):
+    r"""
+    Great circle distance computation result using Vincenty formulae.
+
+    Attributes:
+        distance (float): great circle distance in meters
+        initial_bearing (float): initial bearing in radians
+        final_bearing (float): final bearing in radians
+    """
+    _fields_ = [
+        ("distance", ctypes.c_double),
+        ("initial_bearing", ctypes.c_double),
+        ("final_bearing", ctypes.c_double)
+    ]
+
+    def __repr__(self) -> str:
+        return \
+            f"<{self.distance/1000:.3f}km " \
+            f"initial bearing={self.initial_bearing * _TODEG:.1f}° " \
+            f"final bearing{self.final_bearing * _TODEG:.1f}°>"
+
+
+class Vincenty_dest(ctypes.Structure):
+    """
+    Great circle destination computation result using Vincenty formulae.
+
+    Attributes:
+        longitude (float): destination longitude in radians
+        latitude (float): destination latitude in radians
+        destination_bearing (float): destination bearing in radians
+    """
+    _fields_ = [
+        ("longitude", ctypes.c_double),
+        ("latitude", ctypes.c_double),
+        ("destination_bearing", ctypes.c_double)
+    ]
+
+    def __repr__(self) -> str:
+        return \
+            f"<lon={_dms(self.longitude * _TODEG)} " \
+            f"lat={_dms(self.latitude * _TODEG)} " \
+            f"end bearing={self.destination_bearing * _TODEG:.1f}°>"
+
+
+def distance(
+    obj: dataset.Ellipsoid, start: Geodetic, stop: Geodetic
+) -> Vincenty_dist:
+    """
+    Calculate the distance between two points on the ellipsoid surface.
+
+    Args:
+        obj (dataset.Ellipsoid): The ellipsoid object representing the shape of
+            the Earth.
+        start (Geodetic): The starting point.
+        stop (Geodetic): The destination point.
+
+    Returns:
+        Vincenty_dist: The distance between the two points.
+    """
+    if _geoid is not None:
+        return Vincenty_dist(*_geoid.distance(
+            obj.a, obj.f,
+            start.longitude, start.latitude, stop.longitude, stop.latitude
+        ))
+    return geoid.distance(obj._struct_, start, stop)
+
+
+def distance_array(
+    obj: dataset.Ellipsoid, start: "numpy.ndarray", stop: "numpy.ndarray"
+) -> "numpy.ndarray":
+    """
+    Calculate great circle distances between two arrays of points on the
+    ellipsoid surface.
+
+    Distances are computed by a compiled `numba` ufunc running the Vincenty
+    iteration natively over the whole array, threaded over large inputs;
+    without `numba` installed each pair goes through the scalar C binding.
+
+    Args:
+        obj (dataset.Ellipsoid): The ellipsoid object representing the shape
+            of the Earth.
+        start (numpy.ndarray): `(N, 2)` array of `[longitude, latitude]`
+            rows in degrees.
+        stop (numpy.ndarray): `(N, 2)` array of `[longitude, latitude]`
+            rows in degrees.
+
+    Returns:
+        numpy.ndarray: `(N,)` array of distances in meters.
+    """
+    start = numpy.asarray(start, dtype=numpy.float64)
+    stop = numpy.asarray(stop, dtype=numpy.float64)
+    a, f = obj.a, obj.f
+    if _vincenty_numba is not None:
+        return _vincenty_numba.vincenty_inverse(
+            a, f,
+            start[:, 0] * _TORAD, start[:, 1] * _TORAD,
+            stop[:, 0] * _TORAD, stop[:, 1] * _TORAD
+        )
+    out = numpy.empty(start.shape[0])
+    for i in range(start.shape[0]):
+        out[i] = distance(
+            obj, Geodetic(start[i, 0], start[i, 1]),
+            Geodetic(stop[i, 0], stop[i, 1])
+        ).distance
+    return out
+
+
+def destination(
+    obj: dataset.Ellipsoid, start: Geodetic, dist: Vincenty_dist
+) -> Vincenty_dest:
+    """
+    Calculate the destination point given start point, initial bearing, and
+    distance.
+
+    Args:
+        obj (dataset.Ellipsoid): The ellipsoid object representing the shape of
+            the Earth.
+        start (Geodetic): The starting point.
+        dist (Vincenty_dist): The distance to travel.
+
+    Returns:
+        Vincenty_dest: The destination point.
+    """
+    if _geoid is not None:
+        return Vincenty_dest(*_geoid.destination(
+            obj.a, obj.f,
+            start.longitude, start.latitude,
+            dist.distance, dist.initial_bearing
+        ))
+    return geoid.destination(obj._struct_, start, dist)
+
+
+def _lla_dat2dat_batch(
+    src: dataset.GeodeticCoordRefSystem, dst: dataset.GeodeticCoordRefSystem,
+    lla: "numpy.ndarray"
+) -> "numpy.ndarray":
+    """
+    Apply the datum shift to a `(N, 3)` array of
+    `[longitude, latitude, altitude]` rows given in degrees and meters,
+    looping in C so the `ctypes` transition is paid once for the whole
+    trajectory.
+    """
+    lla = numpy.array(lla, dtype=numpy.float64, order="C")
+    lla[:, :2] *= _TORAD
+    out = numpy.empty_like(lla)
+    geoid.lla_dat2dat_batch(
+        src._struct_, dst._struct_, _dptr(lla), _dptr(out), lla.shape[0]
+    )
+    out[:, :2] *= _TODEG
+    return out
+
+
+def to_crs(
+    obj: dataset.GeodeticCoordRefSystem, crs: dataset.GeodeticCoordRefSystem,
+    lla: typing.Union[Geodetic, "numpy.ndarray"]
+) -> typing.Union[Geodetic, "numpy.ndarray"]:
+    """
+    Convert coordinates from one geodetic coordinate reference system to
+    another.
+
+    Args:
+        obj (dataset.GeodeticCoordRefSystem): The source coordinate reference
+            system.
+        crs (dataset.GeodeticCoordRefSystem): The target coordinate reference
+            system.
+        lla (Geodetic|numpy.ndarray): The coordinates to convert, either a
+            single `Geodetic` point or a `(N, 3)` array of
+            `[longitude, latitude, altitude]` rows in degrees and meters.
+
+    Returns:
+        Geodetic|numpy.ndarray: The converted coordinates.
+    """
+    obj._load_transformation()
+    crs._load_transformation()
+    if numpy is not None and isinstance(lla, numpy.ndarray):
+        return _lla_dat2dat_batch(obj, crs, lla)
+    return geoid.lla_dat2dat(obj._struct_, crs._struct_, lla)
+
+
+def to_wgs84(
+    obj: dataset.GeodeticCoordRefSystem,
+    lla: typing.Union[Geodetic, "numpy.ndarray"]
+) -> typing.Union[Geodetic, "numpy.ndarray"]:
+    """
+    Convert coordinates from a geodetic coordinate reference system to WGS84.
+
+    Args:
+        obj (dataset.GeodeticCoordRefSystem): The source coordinate reference
+            system.
+        lla (Geodetic|numpy.ndarray): The coordinates to convert, either a
+            single `Geodetic` point or a `(N, 3)` array of
+            `[longitude, latitude, altitude]` rows in degrees and meters.
+
+    Returns:
+        Geodetic|numpy.ndarray: The converted coordinates in WGS84.
+    """
+    obj._load_transformation()
+    if numpy is not None and isinstance(lla, numpy.ndarray):
+        return _lla_dat2dat_batch(obj, WGS84, lla)
+    return geoid.lla_dat2dat(obj._struct_, WGS84._struct_, lla)
+
+
+dataset.GeodeticCoordRefSystem.to_wgs84 = to_wgs84
+dataset.GeodeticCoordRefSystem.to_crs = to_crs
+dataset.Ellipsoid.distance = distance
+dataset.Ellipsoid.distance_array = distance_array
+dataset.Ellipsoid.destination = destination
+
+
+class ProjectedCoordRefSystem(dataset.EpsgElement):
+    """
+    Coordinate reference system object allowing projection of geodetic
+    coordinates to flat map (geographic coordinates).
+
+    ```python
+    >>> import epsglide
+    >>> osgb36 = epsglide.ProjectedCoordRefSystem(27700)
+    >>> london = epsglide.Geodetic(-0.127005, 51.518602, 0.)  # use degrees
+    >>> osgb36(london)
+    <metre:1.000[X=529939.106 Y=181680.962] alt=0.000>
+    >>> osgb36.Projection
+    {'Code': 19916, 'Name': 'British National Grid', 'href': 'https://apps.eps\
+g.org/api/v1/Conversion/19916'}
+    ```
+
+    Attributes:
+        GeodeticCoordRefSystem (dataset.GeodeticCoordRefSystem): geodetic
+            reference system.
+        Conversion (dataset.Conversion): projection method and parameters.
+        CoordOperationMethod (dataset.CoordOperationMethod): projection
+            description.
+        CoordSystem (dataset.CoordSystem): 2D coordinate system and units.
+        parameters (list): list of `dataset.CoordOperationParameter`.
+    """
+
+    # populated according to symbols found in proj.so and to the
+    # availability of the numba fallback kernels
+    _proj_forward = None
+    _proj_inverse = None
+    _proj_forward_batch = None
+    _proj_inverse_batch = None
+    _proj_forward_batch_soa = None
+    _proj_inverse_batch_soa = None
+    _proj_transform = None
+    _proj_transform_inverse = None
+    _proj_transform_batch = None
+    _proj_transform_inverse_batch = None
+    _py_kernels = None
+    _specialized = None
+
+    def populate(self):
+        self.GeodeticCoordRefSystem = dataset.GeodeticCoordRefSystem(
+            self.BaseCoordRefSystem["Code"]
+        )
+        self._struct_ = dataset.src.Crs()
+        self._struct_.datum = self.GeodeticCoordRefSystem._struct_
+
+        self.Conversion = dataset.Conversion(self.Projection["Code"])
+        self.CoordOperationMethod = dataset.CoordOperationMethod(
+            self.Conversion.Method["Code"]
+        )
+
+        coordsys = dataset.CoordSystem(self.CoordSys["Code"])
+        self.x_unit = dataset.Unit(coordsys.Axis[0]["Unit"]["Code"])
+        self.y_unit = dataset.Unit(coordsys.Axis[1]["Unit"]["Code"])
+        self.CoordSystem = coordsys
+        self._struct_.x_ratio = self.x_unit.ratio
+        self._struct_.y_ratio = self.y_unit.ratio
+
+        self.parameters = []
+        for param in self.Conversion.ParameterValues:
+            code = param["ParameterCode"]
+            if code in dataset.PROJ_PARAMETER_CODES:
+                attr = dataset.PROJ_PARAMETER_CODES[code]
+                setattr(
+                    self._struct_, attr, param["ParameterValue"] *
+                    (1.0 if attr in _SCALAR_PARAMS else _TORAD)
+                )
+                self.parameters.append(dataset.CoordOperationParameter(code))
+
+        name = dataset.PROJ_METHOD_CODES.get(
+            self.CoordOperationMethod.id, False
+        )
+        if name and _proj_numba is not None:
+            self._py_kernels = _proj_numba.KERNELS.get(name, None)
+        if name and hasattr(proj, f"{name}_forward"):
+            self._proj_forward = getattr(proj, f"{name}_forward")
+            self._proj_forward.restype = Geographic
+            self._proj_forward.argtypes = [_PCrs, _PGeodetic]
+            self._proj_inverse = getattr(proj, f"{name}_inverse")
+            self._proj_inverse.restype = Geodetic
+            self._proj_inverse.argtypes = [_PCrs, _PGeographic]
+            batch_argtypes = [_PCrs, _PDouble, _PDouble, ctypes.c_size_t]
+            self._proj_forward_batch = getattr(proj, f"{name}_forward_batch")
+            self._proj_forward_batch.restype = None
+            self._proj_forward_batch.argtypes = batch_argtypes
+            self._proj_inverse_batch = getattr(proj, f"{name}_inverse_batch")
+            self._proj_inverse_batch.restype = None
+            self._proj_inverse_batch.argtypes = batch_argtypes
+            soa_argtypes = [_PCrs] + [_PDouble] * 6 + [ctypes.c_size_t]
+            self._proj_forward_batch_soa = \
+                getattr(proj, f"{name}_forward_batch_soa")
+            self._proj_forward_batch_soa.restype = None
+            self._proj_forward_batch_soa.argtypes = soa_argtypes
+            self._proj_inverse_batch_soa = \
+                getattr(proj, f"{name}_inverse_batch_soa")
+            self._proj_inverse_batch_soa.restype = None
+            self._proj_inverse_batch_soa.argtypes = soa_argtypes
+            self._proj_transform = getattr(proj, f"{name}_transform")
+            self._proj_transform.restype = Geographic
+            self._proj_transform.argtypes = [_PCrs, _PGeodetic]
+            self._proj_transform_inverse = \
+                getattr(proj, f"{name}_transform_inverse")
+            self._proj_transform_inverse.restype = Geodetic
+            self._proj_transform_inverse.argtypes = [_PCrs, _PGeographic]
+            self._proj_transform_batch = \
+                getattr(proj, f"{name}_transform_batch")
+            self._proj_transform_batch.restype = None
+            self._proj_transform_batch.argtypes = batch_argtypes
+            self._proj_transform_inverse_batch = \
+                getattr(proj, f"{name}_transform_inverse_batch")
+            self._proj_transform_inverse_batch.restype = None
+            self._proj_transform_inverse_batch.argtypes = batch_argtypes
+
+    def __call__(
+        self, element: typing.Union[Geodetic, Geographic, "numpy.ndarray"]
+    ) -> typing.Union[Geodetic, Geographic, "numpy.ndarray"]:
+        """
+        Apply the projection to geodetic coordinates or unapply it to
+        geographic ones.
+
+        A `(N, 3)` `numpy` array of `[longitude, latitude, altitude]` rows
+        (degrees and meters, as in `epsglide.geodesy.Geodetic`
+        initialization) may also be given: all rows are then projected
+        through a single C call, amortizing the `ctypes` dispatch overhead
+        over the whole batch. The result is a `(N, 3)` array of
+        `[x, y, altitude]` rows expressed in projection units. A
+        `(longitudes, latitudes, altitudes)` tuple of 1-dimension arrays is
+        accepted as well and projected through the struct-of-arrays batch
+        entry, returning an `(xs, ys, altitudes)` tuple.
+
+        Arguments:
+            element (Geodetic|Geographic|numpy.ndarray|tuple): coordinates
+                to project (`Geodetic`, array or tuple of arrays) or
+                unproject (`Geographic`).
+        Returns:
+            Geographic|Geodetic|numpy.ndarray|tuple: projection result.
+        """
+        if numpy is not None and isinstance(element, (tuple, list)):
+            lons, lats, alts = element
+            lons = numpy.asarray(lons, dtype=numpy.float64) * _TORAD + \
+                self._struct_.datum.prime.longitude
+            lats = numpy.asarray(lats, dtype=numpy.float64) * _TORAD
+            xs, ys, zs = self.forward((lons, lats, alts))
+            xs /= self.x_unit.ratio
+            ys /= self.y_unit.ratio
+            return xs, ys, zs
+        elif numpy is not None and isinstance(element, numpy.ndarray):
+            lla = numpy.array(element, dtype=numpy.float64, order="C")
+            if self._proj_transform_batch is not None:
+                # fused entry applies prime meridian shift and unit ratios
+                # inside the C loop
+                lla[:, :2] *= _TORAD
+                xya = numpy.empty_like(lla)
+                self._proj_transform_batch(
+                    self._struct_, _dptr(lla), _dptr(xya), lla.shape[0]
+                )
+                return xya
+            lla[:, 0] = \
+                lla[:, 0] * _TORAD + self._struct_.datum.prime.longitude
+            lla[:, 1] *= _TORAD
+            xya = self.forward(lla)
+            xya[:, 0] /= self.x_unit.ratio
+            xya[:, 1] /= self.y_unit.ratio
+            return xya
+        elif isinstance(element, Geodetic):
+            if self._proj_transform is not None:
+                # single ctypes transition doing prime meridian shift,
+                # projection and unit scaling
+                xya = self._proj_transform(self._struct_, element)
+            else:
+                longitude = \
+                    element.longitude + self._struct_.datum.prime.longitude
+                lla = Geodetic(
+                    longitude * _TODEG, element.latitude * _TODEG,
+                    element.altitude
+                )
+                xya = self.forward(lla)
+                xya.x /= self.x_unit.ratio
+                xya.y /= self.y_unit.ratio
+            setattr(xya, "_unit", self.x_unit)
+            return xya
+        else:
+            if self._proj_transform_inverse is not None:
+                return self._proj_transform_inverse(self._struct_, element)
+            xya = Geographic(
+                element.x * self.x_unit.ratio, element.y * self.y_unit.ratio,
+                element.altitude
+            )
+            lla = self.inverse(xya)
+            lla.longitude -= self._struct_.datum.prime.longitude
+            return lla
+
+    def _build_specialized(self) -> None:
+        """
+        Compile scalar kernels specialized for this instance: projection
+        parameters are fixed for the lifetime of the object, so they are
+        frozen as compile-time constants. Built on first use and cached on
+        the instance; the first call pays the compile latency.
+        """
+        forward, inverse = self._py_kernels[:2]
+        params = self._params()
+        self._specialized = (
+            None if forward is None else
+            _proj_numba.specialize(forward, params),
+            None if inverse is None else
+            _proj_numba.specialize(inverse, params)
+        )
+
+    def _params(self) -> tuple:
+        """
+        Return projection parameters as the scalar tuple expected by the
+        numba fallback kernels.
+        """
+        crs = self._struct_
+        ellipsoid = crs.datum.ellipsoid
+        return (
+            ellipsoid.a, ellipsoid.e, crs.lambda0, crs.phi0, crs.phi1,
+            crs.phi2, crs.k0, crs.x0, crs.y0, crs.azimut
+        )
+
+    def forward(
+        self, lla: typing.Union[Geodetic, "numpy.ndarray", tuple]
+    ) -> typing.Union[Geographic, "numpy.ndarray", tuple]:
+        if numpy is not None and isinstance(lla, (tuple, list)):
+            lons, lats, alts = [
+                numpy.ascontiguousarray(arr, dtype=numpy.float64)
+                for arr in lla
+            ]
+            if self._proj_forward_batch_soa is not None:
+                xs = numpy.empty_like(lons)
+                ys = numpy.empty_like(lats)
+                zs = numpy.empty_like(alts)
+                self._proj_forward_batch_soa(
+                    self._struct_, _dptr(lons), _dptr(lats), _dptr(alts),
+                    _dptr(xs), _dptr(ys), _dptr(zs), lons.shape[0]
+                )
+                return xs, ys, zs
+            # no C symbol for this projection: route the columns through
+            # the numba batch kernel
+            lla = numpy.column_stack((lons, lats, alts))
+            xya = numpy.empty_like(lla)
+            self._py_kernels[2](*self._params(), lla, xya)
+            return xya[:, 0], xya[:, 1], xya[:, 2]
+        if numpy is not None and isinstance(lla, numpy.ndarray):
+            lla = numpy.ascontiguousarray(lla, dtype=numpy.float64)
+            xya = numpy.empty_like(lla)
+            if self._proj_forward_batch is not None:
+                self._proj_forward_batch(
+                    self._struct_, _dptr(lla), _dptr(xya), lla.shape[0]
+                )
+            else:
+                self._py_kernels[2](*self._params(), lla, xya)
+            return xya
+        if self._proj_forward is not None:
+            return self._proj_forward(self._struct_, lla)
+        if self._specialized is None:
+            self._build_specialized()
+        x, y = self._specialized[0](lla.longitude, lla.latitude)
+        xya = Geographic()
+        xya.x, xya.y, xya.altitude = x, y, lla.altitude
+        return xya
+
+    def inverse(
+        self, xya: typing.Union[Geographic, "numpy.ndarray", tuple]
+    ) -> typing.Union[Geodetic, "numpy.ndarray", tuple]:
+        if numpy is not None and isinstance(xya, (tuple, list)):
+            xs, ys, zs = [
+                numpy.ascontiguousarray(arr, dtype=numpy.float64)
+                for arr in xya
+            ]
+            if self._proj_inverse_batch_soa is not None:
+                lons = numpy.empty_like(xs)
+                lats = numpy.empty_like(ys)
+                alts = numpy.empty_like(zs)
+                self._proj_inverse_batch_soa(
+                    self._struct_, _dptr(xs), _dptr(ys), _dptr(zs),
+                    _dptr(lons), _dptr(lats), _dptr(alts), xs.shape[0]
+                )
+                return lons, lats, alts
+            # no C symbol for this projection: route the columns through
+            # the numba batch kernel
+            xya = numpy.column_stack((xs, ys, zs))
+            lla = numpy.empty_like(xya)
+            self._py_kernels[3](*self._params(), xya, lla)
+            return lla[:, 0], lla[:, 1], lla[:, 2]
+        if numpy is not None and isinstance(xya, numpy.ndarray):
+            xya = numpy.ascontiguousarray(xya, dtype=numpy.float64)
+            lla = numpy.empty_like(xya)
+            if self._proj_inverse_batch is not None:
+                self._proj_inverse_batch(
+                    self._struct_, _dptr(xya), _dptr(lla), xya.shape[0]
+                )
+            else:
+                self._py_kernels[3](*self._params(), xya, lla)
+            return lla
+        if self._proj_inverse is not None:
+            return self._proj_inverse(self._struct_, xya)
+        if self._specialized is None:
+            self._build_specialized()
+        longitude, latitude = self._specialized[1](xya.x, xya.y)
+        lla = Geodetic()
+        lla.longitude, lla.latitude, lla.altitude = \
+            longitude, latitude, xya.altitude
+        return lla
+
+    def transform(
+        self, element: typing.Union[Geodetic, Geographic], dest_crs
+    ) -> Geographic:
+        """
+        """
+        lla = element if isinstance(element, Geodetic) else self(element)
+        return dest_crs(geoid.lla_dat2da(self._struct, dest_crs._strut_, lla))
+
+
+#: pointer types reused across every binding below and in
+#: `ProjectedCoordRefSystem.populate`, built once instead of going through
+#: the `ctypes.POINTER` machinery on each argtypes assignment
+_PDouble = ctypes.POINTER(ctypes.c_double)
+_PEllipsoid = ctypes.POINTER(dataset.src.Ellipsoid)
+_PDatum = ctypes.POINTER(dataset.src.Datum)
+_PCrs = ctypes.POINTER(dataset.src.Crs)
+_PGeodetic = ctypes.POINTER(Geodetic)
+_PGeocentric = ctypes.POINTER(Geocentric)
+_PGeographic = ctypes.POINTER(Geographic)
+_PVincenty_dist = ctypes.POINTER(Vincenty_dist)
+
+#######################
+# loading C libraries #
+#######################
+# defining library name
+__dll_ext__ = "dll" if sys.platform.startswith("win") else "so"
+geoid = ctypes.CDLL(_get_file("geoid.%s" % __dll_ext__))
+proj = ctypes.CDLL(_get_file("proj.%s" % __dll_ext__))
+
+geoid.geocentric.argtypes = [_PEllipsoid, _PGeodetic]
+geoid.geocentric.restype = Geocentric
+
+geoid.geodetic.argtypes = [_PEllipsoid, _PGeocentric]
+geoid.geodetic.restype = Geodetic
+
+geoid.distance.argtypes = [_PEllipsoid, _PGeodetic, _PGeodetic]
+geoid.distance.restype = Vincenty_dist
+
+geoid.destination.argtypes = [_PEllipsoid, _PGeodetic, _PVincenty_dist]
+geoid.destination.restype = Vincenty_dest
+
+geoid.lla_dat2dat.argtypes = [_PDatum, _PDatum, _PGeodetic]
+geoid.lla_dat2dat.restype = Geodetic
+
+geoid.lla_dat2dat_batch.argtypes = [
+    _PDatum, _PDatum, _PDouble, _PDouble, ctypes.c_size_t
+]
+geoid.lla_dat2dat_batch.restype = None
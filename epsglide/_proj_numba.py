@@ -0,0 +1,294 @@
+# -*- encoding:utf-8 -*-
+
+"""
+Optional pure-python projection kernels compiled with `numba`. They mirror
+the C implementations found in `src/*.c` and are used by
+`epsglide.ProjectedCoordRefSystem` when the matching symbol is not available
+in `proj.so` or when `numpy` arrays have to be processed without crossing
+the `ctypes` boundary.
+
+Kernels are compiled on first use and cached on disk (`cache=True`), so the
+compilation cost is paid once per interpreter installation. Projection
+parameters are read from the `Crs` structure at call time and passed as
+scalar arguments.
+"""
+
+import math
+
+from numba import njit
+
+_EPS = 1e-10
+_MAX_ITER = 100
+
+
+@njit(cache=True)
+def _nhu(a, e, latitude):
+    return a / math.sqrt(1 - (e * math.sin(latitude))**2)
+
+
+@njit(cache=True)
+def _rho(a, e, latitude):
+    return a * (1 - e*e) / (1 - (e * math.sin(latitude))**2)**1.5
+
+
+@njit(cache=True)
+def _clamp_latitude(latitude):
+    return min(max(latitude, -math.pi/2 + _EPS), math.pi/2 - _EPS)
+
+
+@njit(cache=True)
+def _isometric_latitude(e, latitude):
+    sphi = math.sin(latitude)
+    return math.log(
+        math.tan(math.pi/4 + latitude/2) *
+        ((1 - e*sphi) / (1 + e*sphi))**(e/2)
+    )
+
+
+@njit(cache=True)
+def _geodetic_latitude(e, iso_phi):
+    phi_i = 2 * math.atan(math.exp(iso_phi)) - math.pi/2
+    sinphi_i = math.sin(phi_i)
+    phi_ip1 = 2 * math.atan(
+        ((1 + e*sinphi_i) / (1 - e*sinphi_i))**(e/2) * math.exp(iso_phi)
+    ) - math.pi/2
+
+    i = 0
+    while abs(phi_i - phi_ip1) > _EPS and i < _MAX_ITER:
+        phi_i = phi_ip1
+        sinphi_i = math.sin(phi_i)
+        phi_ip1 = 2 * math.atan(
+            ((1 + e*sinphi_i) / (1 - e*sinphi_i))**(e/2) * math.exp(iso_phi)
+        ) - math.pi/2
+        i += 1
+
+    return phi_ip1
+
+
+@njit(cache=True)
+def _meridian_distance(a, e, latitude):
+    e2 = e**2
+    e4 = e**4
+    e6 = e**6
+    e8 = e**8
+    A0 = 1 - e2/4 - 3*e4/64 - 5*e6/256 - 175*e8/16384
+    A2 = -3*e2/8 - 3*e4/32 - 45*e6/1024 - 420*e8/16384
+    A4 = 15*e4/256 + 45*e6/1024 + 525*e8/16384
+    A6 = -35*e6/3072 - 175*e8/12288
+    A8 = 315*e8/131072
+
+    return a * (
+        A0*latitude + A2*math.sin(2*latitude) + A4*math.sin(4*latitude) +
+        A6*math.sin(6*latitude) + A8*math.sin(8*latitude)
+    )
+
+
+@njit(cache=True)
+def _footpoint_latitude(a, e, distance):
+    phi_ip1 = distance/a
+    phi_i = -phi_ip1
+
+    i = 0
+    while abs(phi_i - phi_ip1) > _EPS and i < _MAX_ITER:
+        phi_i = phi_ip1
+        phi_ip1 = phi_i - (_meridian_distance(a, e, phi_i) - distance)/a
+        i += 1
+
+    return phi_ip1
+
+
+# every kernel shares the same scalar interface so dispatch code does not
+# have to know which parameters a given projection actually uses:
+# (a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut, <coordinates>)
+
+@njit(cache=True)
+def latlong_forward(a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut,
+                    longitude, latitude):
+    return longitude, latitude
+
+
+@njit(cache=True)
+def latlong_inverse(a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut,
+                    x, y):
+    return x, y
+
+
+@njit(cache=True)
+def merc_forward(a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut,
+                 longitude, latitude):
+    ak0 = math.cos(abs(phi1)) * _nhu(a, e, phi1)
+    x = x0 + k0 * ak0 * (longitude - lambda0)
+    y = k0 * ak0 * _isometric_latitude(e, _clamp_latitude(latitude - phi0)) \
+        + y0
+    return x, y
+
+
+@njit(cache=True)
+def merc_inverse(a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut, x, y):
+    ak0 = math.cos(abs(phi1)) * _nhu(a, e, phi1)
+    longitude = (x - x0) / (ak0 * k0) + lambda0
+    latitude = _geodetic_latitude(e, (y - y0) / (ak0 * k0)) + phi0
+    return longitude, latitude
+
+
+@njit(cache=True)
+def tmerc_forward(a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut,
+                  longitude, latitude):
+    latitude = _clamp_latitude(latitude)
+    m = _meridian_distance(a, e, latitude) - _meridian_distance(a, e, phi0)
+    v = _nhu(a, e, latitude)
+    B = v / _rho(a, e, latitude)
+    lc = math.cos(latitude) * (longitude - lambda0)
+    t = math.tan(latitude)
+    lc2 = lc*lc
+
+    B2 = B*B
+    B3 = B*B2
+    B4 = B*B3
+    t2 = t*t
+    t4 = t2*t2
+    t6 = t2*t4
+
+    W3 = B - t2
+    W4 = 4*B2 + B - t2
+    W5 = 4*B3*(1 - 6*t2) + B2*(1 + 8*t2) - 2*B*t2 + t4
+    W6 = 8*B4*(11 - 24*t2) - 28*B3*(1 - 6*t2) + B2*(1 - 32*t2) - 2*B*t2 + t4
+    W7_ = 61 - 479*t2 + 179*t4 - t6
+    W8_ = 1385 - 3111*t2 + 543*t4 - t6
+
+    X = v*lc * (1. + lc2 * (W3/6. + lc2 * (W5/120. + lc2*W7_/5040.)))
+    Y = m + v*t*lc2 * (
+        0.5 + lc2 * (W4/24. + lc2 * (W6/720. + lc2*W8_/40320.))
+    )
+
+    return k0*X + x0, k0*Y + y0
+
+
+@njit(cache=True)
+def tmerc_inverse(a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut, x, y):
+    f = _footpoint_latitude(
+        a, e, _meridian_distance(a, e, phi0) + (y - y0)/k0
+    )
+    v = _nhu(a, e, f)
+    x_ = (x - x0) / (k0*v)
+    x2 = x_*x_
+
+    B = v / _rho(a, e, f)
+    t = math.tan(f)
+    c = math.cos(f)
+
+    B2 = B*B
+    B3 = B*B2
+    B4 = B*B3
+    t2 = t*t
+    t4 = t2*t2
+    t6 = t2*t4
+
+    V3 = B + 2*t2
+    V5 = 4*B3*(1 - 6*t2) - B2*(9 - 68*t2) - 72*B*t2 - 24*t4
+    V7_ = 61 + 662*t2 + 1320*t4 + 720*t6
+    U4 = 4*B2 - 9*B*(1 - t2) - 12*t2
+    U6 = 8*B4*(11 - 24*t2) - 12*B3*(21 - 71*t2) + \
+        15*B2*(15 - 98*t2 + 15*t4) + 180*B*(5*t2 - 3*t4) + 360*t4
+    U8_ = -1385 - 3633*t2 - 4095*t4 - 1575*t6
+
+    lambda_ = x_/c * (1. - x2 * (V3/6. + x2 * (V5/120. + x2*V7_/5040.)))
+    phi = f - x2*B*t * (0.5 + x2 * (U4/24. + x2 * (U6/720. + x2*U8_/40320.)))
+
+    return lambda_ + lambda0, phi
+
+
+@njit(cache=True)
+def omerc_forward(a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut,
+                  longitude, latitude):
+    e2 = e*e
+    cphi0 = math.cos(phi0)
+    sphi0 = math.sin(phi0)
+
+    B = math.sqrt(1 + e2*cphi0**4 / (1 - e2))
+    A = math.sqrt(a*B*k0*(1 - e2)) / (1 - e2*math.sin(lambda0)**2)
+    t0 = math.tan(math.pi/4 - phi0/2) / \
+        ((1 - e*sphi0) / (1 + e*sphi0))**(e/2)
+    D = B * math.sqrt(1 - e2) / (cphi0 * math.sqrt(1 - e2*sphi0**2))
+    D2 = D**2 if D > 1 else 1.
+    F = D + math.sqrt(D2 - 1) * (1. if phi0 > 0 else -1.)
+    H = (F*t0)**B
+    G = (F - 1/F) / 2
+    g0 = math.asin(math.sin(azimut) / D)
+    l0 = phi0 - math.asin(G * math.tan(g0)) / B
+    if abs(int(math.cos(azimut))) < _EPS:
+        uc = A * (lambda0 - l0)
+    else:
+        uc = (A/B) * math.atan2(math.sqrt(D2 - 1), math.cos(azimut)) * \
+            (1. if phi0 > 0 else -1.)
+
+    sphi = math.sin(latitude)
+    t = math.tan(math.pi/4 - latitude/2) / \
+        (1 - e*sphi / (1 + e*sphi))**(e/2)
+    Q = H / t**B
+    S = (Q - 1/Q) / 2
+    V = math.sin(B * (longitude - l0))
+    U = -V * math.cos(g0) + S * math.sin(g0)
+    v = A * math.log((1 - U) / (1 + U)) / (2*B)
+    u = A * math.atan2(
+        S * math.cos(g0) + V * math.sin(g0),
+        math.cos(B * (longitude - l0))
+    ) / B
+    u -= uc
+
+    return u + x0, v + y0
+
+
+def _batch(kernel):
+    """
+    Build the `(N, 3)`-array looping counterpart of a scalar kernel.
+    """
+
+    @njit(cache=True)
+    def batch(a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut, src, dst):
+        for i in range(src.shape[0]):
+            dst[i, 0], dst[i, 1] = kernel(
+                a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut,
+                src[i, 0], src[i, 1]
+            )
+            dst[i, 2] = src[i, 2]
+
+    return batch
+
+
+def specialize(kernel, params):
+    """
+    Freeze the projection parameters of a scalar kernel into a compiled
+    closure. `numba` treats closure variables as compile-time constants,
+    so parameter-only subexpressions (`sin(phi0)`, meridian distance of
+    the latitude of origin, ...) are folded away once per
+    `ProjectedCoordRefSystem` instead of being re-evaluated on every call.
+    Compilation happens on first call of the returned closure.
+    """
+    a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut = params
+
+    @njit(cache=False)
+    def specialized(u, v):
+        return kernel(a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut,
+                      u, v)
+
+    return specialized
+
+
+#: kernel table indexed like `dataset.PROJ_METHOD_CODES` values; each entry
+#: is a (forward, inverse, forward_batch, inverse_batch) tuple, `None` when
+#: the direction is not implemented (the C `omerc_inverse` is a stub too).
+KERNELS = {
+    "latlong": (
+        latlong_forward, latlong_inverse,
+        _batch(latlong_forward), _batch(latlong_inverse)
+    ),
+    "merc": (
+        merc_forward, merc_inverse, _batch(merc_forward), _batch(merc_inverse)
+    ),
+    "tmerc": (
+        tmerc_forward, tmerc_inverse,
+        _batch(tmerc_forward), _batch(tmerc_inverse)
+    ),
+    "omerc": (omerc_forward, None, _batch(omerc_forward), None),
+}
@@ -0,0 +1,88 @@
+# -*- encoding:utf-8 -*-
+
+"""
+Optional `numba`-compiled Vincenty inverse formula.
+
+`geoid.distance` crosses the `ctypes` boundary per point, which dominates
+the cost of the math itself on large arrays. The ufunc below runs the same
+iteration natively on `numpy` arrays, multi-threaded over large inputs.
+Importing this module requires `numba`; `epsglide` treats it as optional.
+"""
+
+import math
+
+import numba
+from numba import float64
+
+_EPS = 1e-12
+_MAX_ITER = 100
+
+
+@numba.vectorize(
+    [float64(float64, float64, float64, float64, float64, float64)],
+    nopython=True, target="parallel"
+)
+def vincenty_inverse(a, f, lon1, lat1, lon2, lat2):
+    """
+    Return the great circle distance in meters between two points given in
+    radians on the ellipsoid defined by its semi-major axis `a` and
+    flattening `f`. Same iteration as `distance` in `src/geoid.c`.
+    """
+    b = a * (1.0 - f)
+    L = lon2 - lon1
+    x = L
+    xp1 = L + 1.0
+    U1 = math.atan((1.0 - f) * math.tan(lat1))
+    U2 = math.atan((1.0 - f) * math.tan(lat2))
+    cU1 = math.cos(U1)
+    sU1 = math.sin(U1)
+    cU2 = math.cos(U2)
+    sU2 = math.sin(U2)
+
+    ssigma = 0.0
+    csigma = 1.0
+    sigma = 0.0
+    c2sigma_m = 0.0
+    i = 0
+    while abs(x - xp1) > _EPS and i < _MAX_ITER:
+        sx = math.sin(x)
+        cx = math.cos(x)
+        t1 = cU2 * sx
+        t2 = cU1 * sU2 - sU1 * cU2 * cx
+        ssigma = math.sqrt(t1 * t1 + t2 * t2)
+        if ssigma < _EPS:
+            # coincident points
+            return 0.0
+        csigma = sU1 * sU2 + cU1 * cU2 * cx
+        sigma = math.atan2(ssigma, csigma)
+        salpha = cU1 * cU2 * sx / ssigma
+        calpha2 = 1.0 - salpha * salpha
+        if calpha2 < _EPS:
+            c2sigma_m = 0.0
+        else:
+            c2sigma_m = csigma - 2.0 * sU1 * sU2 / calpha2
+        C = f / 16.0 * calpha2 * (4.0 + f * (4.0 - 3.0 * calpha2))
+        xp1 = x
+        x = L + (1.0 - C) * f * salpha * (
+            sigma + C * ssigma * (
+                c2sigma_m + C * csigma * (
+                    -1.0 + 2.0 * c2sigma_m * c2sigma_m
+                )
+            )
+        )
+        i += 1
+
+    salpha = cU1 * cU2 * math.sin(x) / ssigma
+    calpha2 = 1.0 - salpha * salpha
+    u2 = calpha2 * (a * a - b * b) / (b * b)
+    k1 = (math.sqrt(1.0 + u2) - 1.0) / (math.sqrt(1.0 + u2) + 1.0)
+    A = (1.0 + 0.25 * k1 * k1) / (1.0 - k1)
+    B = k1 * (1.0 - 0.375 * k1 * k1)
+    Dsigma = B * ssigma * (
+        c2sigma_m + B / 4.0 * (
+            csigma * (-1.0 + 2.0 * c2sigma_m * c2sigma_m) -
+            B / 6.0 * c2sigma_m * (-3.0 + 4.0 * ssigma * ssigma) *
+            (-3.0 + 4.0 * c2sigma_m * c2sigma_m)
+        )
+    )
+    return b * A * (sigma - Dsigma)
@@ -0,0 +1,54 @@
+# -*- encoding:utf-8 -*-
+
+"""
+Pre-compile the optional numba projection kernels.
+
+Kernels are decorated with `cache=True`, so compiling them once per
+installation is enough: running this module after install (or in an image
+build) pays the seconds-long JIT latency ahead of time and deployed
+interpreters load the machine code straight from the on-disk cache.
+
+```bash
+$ python -m epsglide._warm_numba
+```
+"""
+
+import sys
+
+#: dummy but valid WGS84-like arguments exercising every parameter slot:
+#: a, e, lambda0, phi0, phi1, phi2, k0, x0, y0, azimut
+_PARAMS = (
+    6378137.0, 0.0818191908426215, 0.1, 0.5, 0.5, 0.6, 0.9996, 500000.0,
+    0.0, 0.1
+)
+
+
+def warm() -> None:
+    """
+    Call every kernel of `epsglide._proj_numba` once on dummy input so its
+    compiled machine code lands in the numba disk cache.
+    """
+    from epsglide import _proj_numba
+
+    try:
+        import numpy
+        dummy = numpy.zeros((1, 3)) + 0.5
+    except ImportError:
+        numpy = dummy = None
+
+    for name, kernels in sorted(_proj_numba.KERNELS.items()):
+        forward, inverse, forward_batch, inverse_batch = kernels
+        sys.stdout.write(f"compiling {name} kernels...\n")
+        if forward is not None:
+            forward(*_PARAMS, 0.1, 0.5)
+        if inverse is not None:
+            inverse(*_PARAMS, 500000.0, 500000.0)
+        if dummy is not None:
+            if forward_batch is not None:
+                forward_batch(*_PARAMS, dummy, numpy.empty_like(dummy))
+            if inverse_batch is not None:
+                inverse_batch(*_PARAMS, dummy * 1e5, numpy.empty_like(dummy))
+
+
+if __name__ == "__main__":
+    warm()
@@ -29,20 +29,57 @@ class Ellipsoid(ctypes.Structure):
     """
     Represents an `Ellipsoid` structure in C code.
 
+    Derived constants are computed once on the python side (see
+    `epsglide.dataset.Ellipsoid.populate`) so C kernels read them from the
+    structure instead of re-deriving them on every projection call.
+
     Attributes:
         a (float): The semi-major axis of the ellipsoid.
         b (float): The semi-minor axis of the ellipsoid.
         e (float): The eccentricity of the ellipsoid.
         f (float): The flattening of the ellipsoid.
+        e2 (float): The squared eccentricity.
+        ep2 (float): The squared second eccentricity.
+        n (float): The third flattening `f/(2-f)`.
+        A0 (float): meridian arc series coefficient.
+        A2 (float): meridian arc series coefficient.
+        A4 (float): meridian arc series coefficient.
+        A6 (float): meridian arc series coefficient.
+        A8 (float): meridian arc series coefficient.
     """
 
     _fields_ = [
         ("a", ctypes.c_double),
         ("b", ctypes.c_double),
         ("e", ctypes.c_double),
-        ("f", ctypes.c_double)
+        ("f", ctypes.c_double),
+        ("e2", ctypes.c_double),
+        ("ep2", ctypes.c_double),
+        ("n", ctypes.c_double),
+        ("A0", ctypes.c_double),
+        ("A2", ctypes.c_double),
+        ("A4", ctypes.c_double),
+        ("A6", ctypes.c_double),
+        ("A8", ctypes.c_double)
     ]
 
+    def derive(self) -> None:
+        """
+        Compute squared eccentricities, third flattening and meridian arc
+        series coefficients from `a`, `e` and `f` values.
+        """
+        e2 = self.e2 = self.e**2
+        self.ep2 = e2 / (1 - e2)
+        self.n = self.f / (2 - self.f)
+        e4 = e2*e2
+        e6 = e2*e4
+        e8 = e2*e6
+        self.A0 = 1 - e2/4 - 3*e4/64 - 5*e6/256 - 175*e8/16384
+        self.A2 = -3*e2/8 - 3*e4/32 - 45*e6/1024 - 420*e8/16384
+        self.A4 = 15*e4/256 + 45*e6/1024 + 525*e8/16384
+        self.A6 = -35*e6/3072 - 175*e8/12288
+        self.A8 = 315*e8/131072
+
 
 class Datum(ctypes.Structure):
     """
@@ -121,6 +158,10 @@ class Crs(ctypes.Structure):
         azimut (float): the azimuthal direction (north zero, east of north
             being positive) of the great circle which is the centre line of an
             oblique projection. The azimuth is given at the projection centre.
+        x_ratio (float): unit ratio of the easting axis, read by the fused
+            transform entry points of `proj.so`.
+        y_ratio (float): unit ratio of the northing axis, read by the fused
+            transform entry points of `proj.so`.
     """
 
     _fields_ = [
@@ -132,5 +173,7 @@ class Crs(ctypes.Structure):
         ("k0", ctypes.c_double),
         ("x0", ctypes.c_double),
         ("y0", ctypes.c_double),
-        ("azimut", ctypes.c_double)
+        ("azimut", ctypes.c_double),
+        ("x_ratio", ctypes.c_double),
+        ("y_ratio", ctypes.c_double)
     ]
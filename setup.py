@@ -27,7 +27,13 @@ class build_ctypes_ext(build_ext):
         return super().get_export_symbols(ext)
 
     def get_ext_filename(self, ext_name):
-        if getattr(self, "_ctypes", False):
+        # resolve from the extension list itself so that CTypes and regular
+        # extensions can be mixed in a single build
+        if any(
+            isinstance(ext, CTypes) and
+            ext.name.split(".")[-1] == ext_name.split(".")[-1].split(os.sep)[-1]
+            for ext in self.extensions
+        ):
             return ext_name.replace(".", os.sep) + (
                 '.dll' if sys.platform.startswith("win") else '.so'
             )
@@ -37,6 +43,13 @@ class build_ctypes_ext(build_ext):
 version = open("./VERSION", "r")
 long_description = open("./README.md", "r")
 
+# OpenMP is used to parallelize the batch projection loops; the pragmas are
+# simply ignored where the toolchain does not enable it
+if sys.platform.startswith("win"):
+    omp_compile_args, omp_link_args = ["/openmp"], []
+else:
+    omp_compile_args, omp_link_args = ["-fopenmp"], ["-fopenmp"]
+
 kw = {
     "version": version.read().strip(),
     "name": "EPSGlide",
@@ -65,15 +78,26 @@ kw = {
     "ext_modules": [
         CTypes(
             'epsglide.geoid',
+            extra_compile_args=omp_compile_args,
+            extra_link_args=omp_link_args,
+            include_dirs=['src/'],
+            sources=[
+                "src/geoid.c"
+            ]
+        ),
+        Extension(
+            'epsglide._geoid',
             extra_compile_args=[],
             include_dirs=['src/'],
             sources=[
+                "src/geoid_module.c",
                 "src/geoid.c"
             ]
         ),
         CTypes(
             'epsglide.proj',
-            extra_compile_args=[],
+            extra_compile_args=omp_compile_args,
+            extra_link_args=omp_link_args,
             include_dirs=['src/'],
             sources=[
                 "src/tmerc.c",
@@ -22,3 +22,7 @@ EXPORT Geodetic eqc_inverse(Crs *crs, Geographic *xya){
 
 	return lla;
 }
+
+DEFINE_PROJ_BATCH(eqc)
+DEFINE_PROJ_BATCH_SOA(eqc)
+DEFINE_PROJ_TRANSFORM(eqc)
@@ -0,0 +1,105 @@
+// Copyright (c) 2015-2024, THOORENS Bruno
+// All rights reserved.
+
+// CPython binding of the Vincenty formulae implemented in geoid.c. Unlike
+// the ctypes entry points, calls exchange raw doubles and tuples with the
+// interpreter, avoiding the generic ctypes marshaller on each call.
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include "./geoid.h"
+
+// prototypes of the entry points defined in geoid.c
+extern Vincenty_dist distance(Ellipsoid *ellps, Geodetic *start, Geodetic *stop);
+extern Vincenty_dest destination(Ellipsoid *ellps, Geodetic *start, Vincenty_dist *dbb);
+
+static void init_ellipsoid(Ellipsoid *ellps, double a, double f){
+    double e2, e4, e6, e8;
+
+    ellps->a = a;
+    ellps->f = f;
+    ellps->b = a * (1 - f);
+    e2 = ellps->e2 = 2*f - f*f;
+    ellps->e = sqrt(e2);
+    ellps->ep2 = e2 / (1 - e2);
+    ellps->n = f / (2 - f);
+    e4 = e2*e2; e6 = e2*e4; e8 = e2*e6;
+    ellps->A0 = 1 - e2/4 - 3*e4/64 - 5*e6/256 - 175*e8/16384;
+    ellps->A2 = -3*e2/8 - 3*e4/32 - 45*e6/1024 - 420*e8/16384;
+    ellps->A4 = 15*e4/256 + 45*e6/1024 + 525*e8/16384;
+    ellps->A6 = -35*e6/3072 - 175*e8/12288;
+    ellps->A8 = 315*e8/131072;
+}
+
+PyDoc_STRVAR(distance_doc,
+"distance(a, f, lon1, lat1, lon2, lat2) -> (distance, initial_bearing, "
+"final_bearing)\n\n"
+"Great circle distance between two geodetic points (radians) on the\n"
+"ellipsoid defined by its semi-major axis and flattening.");
+
+static PyObject *
+geoid_distance(PyObject *module, PyObject *args){
+    Ellipsoid ellps;
+    Geodetic start, stop;
+    Vincenty_dist result;
+    double a, f;
+
+    if (!PyArg_ParseTuple(
+        args, "dddddd", &a, &f,
+        &start.longitude, &start.latitude, &stop.longitude, &stop.latitude
+    )) return NULL;
+
+    init_ellipsoid(&ellps, a, f);
+    start.altitude = stop.altitude = 0;
+    result = distance(&ellps, &start, &stop);
+
+    return Py_BuildValue(
+        "ddd", result.distance, result.initial_bearing, result.final_bearing
+    );
+}
+
+PyDoc_STRVAR(destination_doc,
+"destination(a, f, lon, lat, distance, initial_bearing) -> (longitude, "
+"latitude, destination_bearing)\n\n"
+"Great circle destination from a geodetic point (radians) on the\n"
+"ellipsoid defined by its semi-major axis and flattening.");
+
+static PyObject *
+geoid_destination(PyObject *module, PyObject *args){
+    Ellipsoid ellps;
+    Geodetic start;
+    Vincenty_dist dbb;
+    Vincenty_dest result;
+    double a, f;
+
+    if (!PyArg_ParseTuple(
+        args, "dddddd", &a, &f,
+        &start.longitude, &start.latitude, &dbb.distance,
+        &dbb.initial_bearing
+    )) return NULL;
+
+    init_ellipsoid(&ellps, a, f);
+    start.altitude = 0;
+    dbb.final_bearing = 0;
+    result = destination(&ellps, &start, &dbb);
+
+    return Py_BuildValue(
+        "ddd", result.longitude, result.latitude, result.destination_bearing
+    );
+}
+
+static PyMethodDef geoid_methods[] = {
+    {"distance", geoid_distance, METH_VARARGS, distance_doc},
+    {"destination", geoid_destination, METH_VARARGS, destination_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef geoid_module = {
+    PyModuleDef_HEAD_INIT, "_geoid",
+    "C binding of Vincenty great circle computation.", -1, geoid_methods
+};
+
+PyMODINIT_FUNC
+PyInit__geoid(void){
+    return PyModule_Create(&geoid_module);
+}
@@ -52,10 +52,11 @@ EXPORT Geographic lcc_forward(Crs *crs, Geodetic *lla){
 
 EXPORT Geodetic lcc_inverse(Crs *crs, Geographic *xya){
 	Geodetic lla;
-	double R, v, result[5];
+	double R, v, dx, dy, result[5];
 
 	coef(result, crs->datum.ellipsoid.a, crs->datum.ellipsoid.e, crs->lambda0, crs->phi0, crs->phi1, crs->phi2, crs->x0, crs->y0, crs->k0);
-	R = sqrt(pow(xya->x-result[3], 2) + pow(xya->y-result[4], 2));
+	dx = xya->x - result[3]; dy = xya->y - result[4];
+	R = sqrt(dx*dx + dy*dy);
 	v = atan2(xya->x-result[3], result[4]-xya->y);
 
 	lla.longitude = result[0] + v/result[1];
@@ -64,3 +65,7 @@ EXPORT Geodetic lcc_inverse(Crs *crs, Geographic *xya){
 
 	return lla;
 }
+
+DEFINE_PROJ_BATCH(lcc)
+DEFINE_PROJ_BATCH_SOA(lcc)
+DEFINE_PROJ_TRANSFORM(lcc)
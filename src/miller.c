@@ -29,3 +29,7 @@ EXPORT Geodetic miller_inverse(Crs *crs, Geographic *xya){
 
 	return lla;
 }
+
+DEFINE_PROJ_BATCH(miller)
+DEFINE_PROJ_BATCH_SOA(miller)
+DEFINE_PROJ_TRANSFORM(miller)